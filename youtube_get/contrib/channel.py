@@ -1,16 +1,46 @@
 # -*- coding: utf-8 -*-
 """Module for interacting with a user's youtube channel."""
-import json
 import logging
+import re
 from collections.abc import Sequence
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from youtube_get.contrib.youtube import YouTube
 from youtube_get.utils import extract, request
-from youtube_get.utils.helpers import cache, DeferredGeneratorList, install_proxy, uniqueify
+from youtube_get.utils.exceptions import HTMLParseError
+from youtube_get.utils.helpers import cache, DeferredGeneratorList, DeferredMappedList, install_proxy
+from youtube_get.utils.parser import find_object_from_startpoint
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logger = logging.getLogger("YouTube-Get-Global-Logger")
 
+# Patterns for locating the Videos tab grid in the raw ytInitialData of the page html
+_INITIAL_DATA_RE = re.compile(r"ytInitialData['\"]?]?\s*=\s*")
+_TABS_RE = re.compile(r'"twoColumnBrowseResultsRenderer":\{"tabs":')
+_TAB_RE = re.compile(r'\{"tabRenderer":')
+_GRID_ITEMS_RE = re.compile(r'"richGridRenderer":\{"contents":')
+_CONTINUATION_ITEM = '{"continuationItemRenderer":'
+
+# Patterns for pulling the same fields straight out of the grid items
+_VIDEO_ID_RE = re.compile(r'"videoRenderer":\{"videoId":"([\w-]{11})"')
+_CONTINUATION_TOKEN_RE = re.compile(r'"continuationCommand":\{"token":"([^"]+)"')
+
+# Cached html property of every channel page, keyed by page name
+_PAGE_HTML_ATTRIBUTES = {
+    "videos": "html",
+    "playlists": "playlists_html",
+    "community": "community_html",
+    "featured_channels": "featured_channels_html",
+    "about": "about_html",
+}
+
 
 class Channel:
     """Load a YouTube channel with URL"""
@@ -32,22 +62,11 @@ class Channel:
         self.channel_uri = extract.channel_name(url)
         self.channel_url = f"https://www.youtube.com{self.channel_uri}"
 
-        # These need to be initialized as None for the properties.
-        self._html = None
-        self._ytcfg = None
-        self._initial_data = None
-
         self.videos_url = self.channel_url + '/videos'
         self.playlists_url = self.channel_url + '/playlists'
         self.community_url = self.channel_url + '/community'
         self.featured_channels_url = self.channel_url + '/channels'
         self.about_url = self.channel_url + '/about'
-        
-        # Possible future additions
-        self._playlists_html = None
-        self._community_html = None
-        self._featured_channels_html = None
-        self._about_html = None
 
     @property
     def channel_name(self):
@@ -74,81 +93,106 @@ class Channel:
         """
         return self.initial_data['metadata']['channelMetadataRenderer'].get('vanityChannelUrl', None)  # noqa:E501
 
-    @property
+    @cached_property
     def html(self):
         """Get the html for the /videos page.
         """
-        if self._html:
-            return self._html
-        self._html = request.get(self.videos_url)
-        return self._html
+        return request.get(self.videos_url)
 
-    @property
+    @cached_property
     def playlists_html(self):
         """Get the html for the /playlists page.
 
         Currently unused for any functionality.
         """
-        if self._playlists_html:
-            return self._playlists_html
-        else:
-            self._playlists_html = request.get(self.playlists_url)
-            return self._playlists_html
+        return request.get(self.playlists_url)
 
-    @property
+    @cached_property
     def community_html(self):
         """Get the html for the /community page.
 
         Currently unused for any functionality.
         """
-        if self._community_html:
-            return self._community_html
-        else:
-            self._community_html = request.get(self.community_url)
-            return self._community_html
+        return request.get(self.community_url)
 
-    @property
+    @cached_property
     def featured_channels_html(self):
         """Get the html for the /channels page.
 
         Currently unused for any functionality.
         """
-        if self._featured_channels_html:
-            return self._featured_channels_html
-        else:
-            self._featured_channels_html = request.get(self.featured_channels_url)
-            return self._featured_channels_html
+        return request.get(self.featured_channels_url)
 
-    @property
+    @cached_property
     def about_html(self):
         """Get the html for the /about page.
 
         Currently unused for any functionality.
         """
-        if self._about_html:
-            return self._about_html
-        else:
-            self._about_html = request.get(self.about_url)
-            return self._about_html
+        return request.get(self.about_url)
 
-    @property
+    @cached_property
     def ytcfg(self) -> dict:
         """Extract the ytcfg from the playlist page html.
         """
-        if self._ytcfg:
-            return self._ytcfg
-        self._ytcfg = extract.get_ytcfg(self.html)
-        return self._ytcfg
+        return extract.get_ytcfg(self.html)
 
-    @property
+    @cached_property
     def initial_data(self) -> dict:
         """Extract the initial data from the playlist page html.
         """
-        if self._initial_data:
-            return self._initial_data
-        else:
-            self._initial_data = extract.initial_data(self.html)
-            return self._initial_data
+        return extract.initial_data(self.html)
+
+    def prefetch(self, *pages: str) -> None:
+        """Download several channel pages in parallel.
+
+        This is an optional pre-warm: each page is otherwise downloaded on first
+        access of its html property, one request after another. Pages that are
+        already cached are skipped.
+
+        Args:
+            pages (str): Names of the pages to fetch, any of "videos", "playlists",
+                "community", "featured_channels" and "about". Fetches all of them
+                if none is given.
+        """
+        pages = pages or tuple(_PAGE_HTML_ATTRIBUTES)
+        pending = {}
+        for page in pages:
+            if page not in _PAGE_HTML_ATTRIBUTES:
+                raise ValueError(f"Unknown channel page: {page}")
+            attribute = _PAGE_HTML_ATTRIBUTES[page]
+            if attribute not in self.__dict__:
+                pending[attribute] = getattr(self, f"{page}_url")
+
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {executor.submit(request.get, url): attribute for attribute, url in pending.items()}
+            for future in as_completed(futures):
+                # fill the cached_property slots directly
+                self.__dict__[futures[future]] = future.result()
+
+    @cached_property
+    def _session(self) -> request.Session:
+        """Persistent connection reused by the continuation requests.
+        """
+        return request.Session()
+
+    def close(self) -> None:
+        """Close the connection kept open for the continuation requests, if any.
+
+        This also happens on its own once all videos have been paginated.
+        """
+        session = self.__dict__.pop("_session", None)
+        if session:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @property
     def yt_api_key(self) -> str:
@@ -156,15 +200,16 @@ class Channel:
         """
         return self.ytcfg['INNERTUBE_API_KEY']
 
-    def _paginate(self) -> Iterable[List[str]]:
-        """Parse the video Ids from the page source, and yields the list of videoID
+    def _paginate(self) -> Iterable[Iterable[str]]:
+        """Parse the video Ids from the page source, and yields them page by page
 
         Yields:
-            Iterable of lists of YouTube watch ids
+            Lazy iterators of YouTube watch ids, one per page
         """
-        videos_Ids, continuation = self._extract_videos(
-            json.dumps(extract.initial_data(self.html))
-        )
+        videos_Ids, continuation = self._extract_videos_regex(self.html)
+        if not videos_Ids:
+            # the page layout changed, take the slow but thorough way
+            videos_Ids, continuation = self._extract_videos_from_data(self.initial_data)
         yield videos_Ids
 
         # Extraction from a playlist only returns 100 videos at a time
@@ -176,20 +221,24 @@ class Channel:
         else:
             load_more_url, headers, data = None, None, None
 
-        while load_more_url and headers and data:  # there is an url found
-            logger.debug("load more url: {}".format(load_more_url))
-            # requesting the next page of videos with the url generated from the
-            # previous page, needs to be a post
-            req = request.post(load_more_url, extra_headers=headers, data=data)
-            # extract up to 100 songs from the page loaded
-            # returns another continuation if more videos are available
-            videos_Ids, continuation = self._extract_videos(req)
-            yield videos_Ids
-
-            if continuation:
-                load_more_url, headers, data = self._build_continuation_url(continuation)
-            else:
-                load_more_url, headers, data = None, None, None
+        try:
+            while load_more_url and headers and data:  # there is an url found
+                logger.debug("load more url: %s", load_more_url)
+                # requesting the next page of videos with the url generated from the
+                # previous page, needs to be a post
+                req = self._session.post(load_more_url, extra_headers=headers, data=data)
+                # extract up to 100 songs from the page loaded
+                # returns another continuation if more videos are available
+                videos_Ids, continuation = self._extract_videos(req)
+                yield videos_Ids
+
+                if continuation:
+                    load_more_url, headers, data = self._build_continuation_url(continuation)
+                else:
+                    load_more_url, headers, data = None, None, None
+        finally:
+            # also runs when the generator is abandoned and garbage collected
+            self.close()
 
     def _build_continuation_url(self, continuation: str) -> Tuple[str, dict, dict]:
         """Helper method to build the url and headers required to request the next page of videos
@@ -223,32 +272,105 @@ class Channel:
         )
 
     @staticmethod
-    def _extract_videos(raw_json: str) -> Tuple[List[str], Optional[str]]:
+    def _videos_grid_items_json(html: str) -> Optional[str]:
+        """Finds the raw json of the Videos tab grid items in the page html, without parsing it
+
+        Args:
+            html (str): Html of the /videos page
+
+        Returns:
+            The richGridRenderer contents array of the Videos tab as a string, or None
+            if the page doesn't have the expected layout
+        """
+        match = _INITIAL_DATA_RE.search(html)
+        if match:
+            match = _TABS_RE.search(html, match.end())
+        if not match:
+            return None
+
+        try:
+            tabs = find_object_from_startpoint(html, match.end())
+            tab_match = _TAB_RE.search(tabs)
+            while tab_match:
+                tab = find_object_from_startpoint(tabs, tab_match.start())
+                # the tab's own title comes before its content
+                title_index = tab.find('"title":"Videos"')
+                content_index = tab.find('"content":')
+                if title_index != -1 and (content_index == -1 or title_index < content_index):
+                    grid_match = _GRID_ITEMS_RE.search(tab)
+                    if not grid_match:
+                        return None
+                    return find_object_from_startpoint(tab, grid_match.end())
+                tab_match = _TAB_RE.search(tabs, tab_match.start() + len(tab))
+        except (HTMLParseError, IndexError):
+            pass
+        return None
+
+    @classmethod
+    def _extract_videos_regex(cls, html: str) -> Tuple[List[str], Optional[str]]:
+        """Extracts videos straight from the Videos tab in the page html, without parsing its json
+
+        Args:
+            html (str): Html of the /videos page
+        
+        Returns: 
+            Tuple containing a list of the video watch ids found and a continuation
+            token, if more videos are available
+        """
+        items = cls._videos_grid_items_json(html)
+        if items is None:
+            return [], None
+
+        video_Ids = list(dict.fromkeys(_VIDEO_ID_RE.findall(items)))
+
+        # Only a continuationItemRenderer closing the items array continues the grid,
+        # other tokens (e.g. the sort chips in the grid header) reload the tab instead
+        continuation = None
+        item_start = items.rfind(_CONTINUATION_ITEM)
+        if item_start != -1:
+            item = find_object_from_startpoint(items, item_start)
+            if item_start + len(item) == len(items) - 1:
+                match = _CONTINUATION_TOKEN_RE.search(item)
+                continuation = match.group(1) if match else None
+        return video_Ids, continuation
+
+    @classmethod
+    def _extract_videos(cls, raw_json: str) -> Tuple[Iterable[str], Optional[str]]:
         """Extracts videos from a raw json page
 
         Args:
             raw_json (str): Input json extracted from the page or the last server response
         
         Returns: 
-            Tuple containing a list of up to 100 video watch ids and a continuation token, 
-            if more videos are available
+            Tuple containing a lazy iterator over up to 100 video watch ids and a
+            continuation token, if more videos are available
+        """
+        return cls._extract_videos_from_data(_json.loads(raw_json))
+
+    @classmethod
+    def _extract_videos_from_data(cls, initial_data: dict) -> Tuple[Iterable[str], Optional[str]]:
+        """Extracts videos from already parsed json data
+
+        Args:
+            initial_data (dict): Json data extracted from the page or the last server response
+        
+        Returns: 
+            Tuple containing a lazy iterator over up to 100 video watch ids and a
+            continuation token, if more videos are available
         """
-        initial_data = json.loads(raw_json)
         # this is the json tree structure, if the json was extracted from html
 
         try:
             videos_tab = initial_data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][1]
             assert videos_tab["tabRenderer"]["title"] == "Videos"
             items_list = videos_tab["tabRenderer"]["content"]["richGridRenderer"]["contents"]
-            video_Ids = [item["richItemRenderer"]["content"]["videoRenderer"]["videoId"] for item in items_list[:-1]] # the last one is for continuation
         except (KeyError, IndexError, TypeError, AssertionError) as err1:
             try:
                 items_list = initial_data['onResponseReceivedActions'][0][
                         'appendContinuationItemsAction']['continuationItems']
-                video_Ids = video_Ids = [item["richItemRenderer"]["content"]["videoRenderer"]["videoId"] for item in items_list[:-1]]
             except (KeyError, IndexError, TypeError) as err2:
-                logger.error(f"parse videos firstly -> {repr(err1)}")
-                logger.error(f"parse videos secondly -> {repr(err2)}")
+                logger.error("parse videos firstly -> %r", err1)
+                logger.error("parse videos secondly -> %r", err2)
                 # with open("./show-initial-data.json", "w", encoding="utf-8") as file:
                 #     json.dump(initial_data, file, indent=4, ensure_ascii=False)
                 return [], None
@@ -258,18 +380,38 @@ class Channel:
                 'continuationEndpoint']['continuationCommand']['token']
         except (KeyError, IndexError) as err:
             # if there is an error, no continuation is available
-            logger.error(f"parse continuation -> {repr(err)}")
+            logger.error("parse continuation -> %r", err)
             continuation = None
 
-        video_Ids = uniqueify(video_Ids)
+        return cls._iter_video_ids(items_list), continuation
 
-        return video_Ids, continuation
+    @staticmethod
+    def _iter_video_ids(items_list: List[dict]) -> Iterator[str]:
+        """Lazily yields the video ids of a page of items
+
+        Args:
+            items_list (list): Items of a page, the last one is for continuation
+
+        Yields:
+            YouTube watch ids, items without a video are skipped
+        """
+        # iterate in place instead of copying items_list[:-1]
+        for item in islice(items_list, max(len(items_list) - 1, 0)):
+            try:
+                yield item["richItemRenderer"]["content"]["videoRenderer"]["videoId"]
+            except (KeyError, IndexError, TypeError) as err:
+                # shelves such as richSectionRenderer are expected between the videos
+                logger.debug("skip item without a video -> %r", err)
 
     def url_generator(self):
         """Generator that yields video URLs.
         """
+        seen = set()
         for page in self._paginate():
             for videoID in page:
+                if videoID in seen:
+                    continue
+                seen.add(videoID)
                 yield f"https://www.youtube.com/watch?v={videoID}"
 
     @property  # type: ignore
@@ -285,7 +427,9 @@ class Channel:
     
     @property
     def videos(self) -> Iterable[YouTube]:
-        """Yields YouTube objects of videos in this playlist
+        """Yields YouTube objects of videos in this channel
+
+        The objects are built on access from the cached video_urls.
         """
-        return DeferredGeneratorList(self.videos_generator())
+        return DeferredMappedList(self.video_urls, YouTube)
 
@@ -115,8 +115,8 @@ class Playlist(Sequence):
         :rtype: Iterable[List[str]]
         :returns: Iterable of lists of YouTube watch ids
         """
-        videos_urls, continuation = self._extract_videos(
-            json.dumps(extract.initial_data(self.html))
+        videos_urls, continuation = self._extract_videos_from_data(
+            extract.initial_data(self.html)
         )
         if until_watch_id:
             try:
@@ -193,8 +193,8 @@ class Playlist(Sequence):
             }
         )
 
-    @staticmethod
-    def _extract_videos(raw_json: str) -> Tuple[List[str], Optional[str]]:
+    @classmethod
+    def _extract_videos(cls, raw_json: str) -> Tuple[List[str], Optional[str]]:
         """Extracts videos from a raw json page
 
         Args:
@@ -204,7 +204,19 @@ class Playlist(Sequence):
             Tuple containing a list of up to 100 video watch ids and a continuation token, 
             if more videos are available
         """
-        initial_data = json.loads(raw_json)
+        return cls._extract_videos_from_data(json.loads(raw_json))
+
+    @staticmethod
+    def _extract_videos_from_data(initial_data: dict) -> Tuple[List[str], Optional[str]]:
+        """Extracts videos from already parsed json data
+
+        Args:
+            initial_data (dict): Json data extracted from the page or the last server response
+        
+        Returns: 
+            Tuple containing a list of up to 100 video watch ids and a continuation token, 
+            if more videos are available
+        """
         try:
             # this is the json tree structure, if the json was extracted from
             # html
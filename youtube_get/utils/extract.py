@@ -5,6 +5,7 @@ import urllib.parse
 import re
 from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, quote, urlencode, urlparse
 
@@ -149,6 +150,7 @@ def playlist_id(url: str) -> str:
     return parse_qs(parsed.query)['list'][0]
 
 
+@lru_cache(maxsize=32)
 def channel_name(url: str) -> str:
     """Extract the ``channel_name`` or ``channel_id`` from a YouTube url.
 
@@ -107,6 +107,78 @@ class DeferredGeneratorList:
                 self._elements.append(next_item)
 
 
+class DeferredMappedList:
+    """A read-only view applying a function to the items of another list.
+
+    Items are built the first time they are accessed and kept by index, so
+    nothing is built in bulk, repeated access returns the same object, and
+    wrapping an already cached list (like a :class:`DeferredGeneratorList`)
+    does not need a second full copy of it.
+    """
+    def __init__(self, items, func: Callable):
+        """
+        Args:
+            items: The list-like object to take the items from.
+            func (callable): The function to apply to each accessed item.
+        """
+        self.items = items
+        self.func = func
+        self._built: Dict[int, Any] = {}
+
+    def _build(self, index: int) -> Any:
+        """Build the item at a non-negative index, unless it already was."""
+        if index not in self._built:
+            self._built[index] = self.func(self.items[index])
+        return self._built[index]
+
+    def __eq__(self, other):
+        """We want to mimic list behavior for comparison."""
+        return list(self) == other
+
+    def __getitem__(self, key) -> Any:
+        """Only build the items that are asked for."""
+        # We only allow querying with indexes.
+        if not isinstance(key, (int, slice)):
+            raise TypeError('Key must be either a slice or int.')
+
+        if isinstance(key, int):
+            if key < 0:
+                key += len(self)
+                if key < 0:
+                    raise IndexError
+            return self._build(key)
+
+        if key.step == 0:
+            raise ValueError('slice step cannot be zero')
+        start, stop, step = key.start or 0, key.stop, key.step or 1
+        if start < 0 or stop is None or stop < 0 or step < 0:
+            # Relative bounds need the full length
+            return [self._build(i) for i in range(*key.indices(len(self)))]
+
+        result = []
+        for i in range(start, stop, step):
+            try:
+                result.append(self._build(i))
+            except IndexError:
+                break
+        return result
+
+    def __iter__(self):
+        """Build the items one at a time while iterating."""
+        for index, item in enumerate(self.items):
+            if index not in self._built:
+                self._built[index] = self.func(item)
+            yield self._built[index]
+
+    def __len__(self) -> int:
+        """Return length of the underlying list."""
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        """String representation of all items."""
+        return str(list(self))
+
+
 def regex_search(pattern: str, string: str, group: int) -> str:
     """Shortcut method to search a string for a given pattern.
 
@@ -246,10 +318,25 @@ def target_directory(output_path: Optional[str] = None) -> str:
     return output_path
 
 
+# Proxies of the opener installed by install_proxy, None until it is called
+_installed_proxies: Optional[Dict[str, str]] = None
+
+
 def install_proxy(proxy_handler: Dict[str, str]) -> None:
+    global _installed_proxies
     proxy_support = request.ProxyHandler(proxy_handler)
     opener = request.build_opener(proxy_support)
     request.install_opener(opener)
+    _installed_proxies = dict(proxy_handler)
+
+
+def installed_proxies() -> Optional[Dict[str, str]]:
+    """Get the proxies last installed with :func:`install_proxy`.
+
+    Returns:
+        The proxies keyed by url scheme, or None if no proxy was ever installed.
+    """
+    return _installed_proxies
 
 
 def uniqueify(duped_list: List) -> List:
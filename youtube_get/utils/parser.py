@@ -1,9 +1,46 @@
 import ast
-import json
 import re
+from functools import lru_cache
 
 from youtube_get.utils.exceptions import HTMLParseError
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+# Scanner contexts mapped to the character that closes them
+_CONTEXT_CLOSERS = {
+    '{': '}',
+    '[': ']',
+    '"': '"',
+    '/': '/' # javascript regex
+}
+
+# Contexts whose contents are opaque apart from backslash escapes
+_STRING_CONTEXTS = frozenset(['"', '/'])
+
+# A slash following one of these starts a javascript regex rather than a division
+_REGEX_PRECEDERS = frozenset(['(', ',', '=', ':', '[', '!', '&', '|', '?', '{', '}', ';'])
+
+# The only characters that can change the scanner state inside each context
+_CONTEXT_TOKEN_REGEXES = {
+    '{': re.compile(r'[{}\[\]"/]'),
+    '[': re.compile(r'[{}\[\]"/]'),
+    '"': re.compile(r'["\\]'),
+    '/': re.compile(r'[/\\]'),
+}
+
+_COMMA_RE = re.compile(r",")
+_FUNC_RE = re.compile(r"function\([^)]*\)")
+
+
+@lru_cache(maxsize=128)
+def _compile(preceding_regex: str):
+    """Compiles a preceding regex once and reuses it for later parses."""
+    return re.compile(preceding_regex)
+
 
 def parse_for_all_objects(html: str, preceding_regex: str):
     """Parses input html to find all matches for the input starting point.
@@ -16,7 +53,7 @@ def parse_for_all_objects(html: str, preceding_regex: str):
         A list of dicts created from parsing the objects.
     """
     result = []
-    regex = re.compile(preceding_regex)
+    regex = _compile(preceding_regex)
     match_iter = regex.finditer(html)
     for match in match_iter:
         if match:
@@ -47,7 +84,7 @@ def parse_for_object(html: str, preceding_regex: str) -> dict:
     Returns:
         A dict created from parsing the object.
     """
-    regex = re.compile(preceding_regex)
+    regex = _compile(preceding_regex)
     result = regex.search(html)
     if not result:
         raise HTMLParseError(f'No matches for regex {preceding_regex}')
@@ -66,56 +103,76 @@ def find_object_from_startpoint(html: str, start_point: int):
     Returns:
         A dict created from parsing the object.
     """
-    html = html[start_point:]
-    if html[0] not in ['{','[']:
-        raise HTMLParseError(f'Invalid start point. Start of HTML:\n{html[:20]}')
+    if html[start_point] not in ['{','[']:
+        raise HTMLParseError(f'Invalid start point. Start of HTML:\n{html[start_point:start_point + 20]}')
+
+    return html[start_point:_find_object_end(html, start_point)]
+
+
+def _find_object_end(html: str, start_point: int) -> int:
+    """Finds the end of a JavaScript object.
+
+    The scan runs on the original string, so no copy of the (possibly huge)
+    remainder of the html is made.
+
+    Args:
+        html (str): HTML to be parsed for an object.
+        start_point (int): Index of the opening brace or bracket of the object.
 
+    Returns:
+        The index right after the character closing the object.
+    """
     # First letter MUST be a open brace, so we put that in the stack,
     # and skip the first character.
-    last_char = '{'
-    curr_char = None
-    stack = [html[0]]
-    i = 1
+    stack = [html[start_point]]
+    i = start_point + 1
 
-    context_closers = {
-        '{': '}',
-        '[': ']',
-        '"': '"',
-        '/': '/' # javascript regex
-    }
+    while len(stack) > 0:
+        curr_context = stack[-1]
 
-    while i < len(html):
-        if len(stack) == 0:
+        # Jump straight to the next character that matters in this context,
+        #  everything in between can neither open nor close anything
+        match = _CONTEXT_TOKEN_REGEXES[curr_context].search(html, i)
+        if not match:
+            i = len(html)
             break
-        if curr_char not in [' ', '\n']:
-            last_char = curr_char
+        i = match.start()
         curr_char = html[i]
-        curr_context = stack[-1]
 
         # If we've reached a context closer, we can remove an element off the stack
-        if curr_char == context_closers[curr_context]:
+        if curr_char == _CONTEXT_CLOSERS[curr_context]:
             stack.pop()
             i += 1
             continue
 
         # Strings and regex expressions require special context handling because they can contain
         #  context openers *and* closers
-        if curr_context in ['"', '/']:
+        if curr_context in _STRING_CONTEXTS:
             # If there's a backslash in a string or regex expression, we skip a character
             if curr_char == '\\':
                 i += 2
                 continue
         else:
             # Non-string contexts are when we need to look for context openers.
-            if curr_char in context_closers.keys():
+            if curr_char in _CONTEXT_CLOSERS:
                 # Slash starts a regular expression depending on context
-                if not (curr_char == '/' and last_char not in ['(', ',', '=', ':', '[', '!', '&', '|', '?', '{', '}', ';']): 
+                if not (curr_char == '/' and _last_char(html, i, start_point) not in _REGEX_PRECEDERS):
                     stack.append(curr_char)
 
         i += 1
 
-    full_obj = html[:i]
-    return full_obj  # noqa: R504
+    return i
+
+
+def _last_char(html: str, i: int, start_point: int):
+    """Finds the last character before index ``i`` that is not a space or newline.
+
+    The opening character at ``start_point`` is never reported, ``None`` is returned instead.
+    """
+    i -= 1
+    while i > start_point and html[i] in [' ', '\n']:
+        i -= 1
+    return html[i] if i > start_point else None
 
 
 def parse_for_object_from_startpoint(html, start_point):
@@ -130,8 +187,8 @@ def parse_for_object_from_startpoint(html, start_point):
     """
     full_obj = find_object_from_startpoint(html, start_point)
     try:
-        return json.loads(full_obj)
-    except json.decoder.JSONDecodeError:
+        return _json.loads(full_obj)
+    except ValueError:
         try:
             return ast.literal_eval(full_obj)
         except (ValueError, SyntaxError):
@@ -150,34 +207,30 @@ def throttling_array_split(js_array: str):
         A list of strings representing splits on `,` in the throttling array.
     """
     results = []
-    curr_substring = js_array[1:]
-
-    comma_regex = re.compile(r",")
-    func_regex = re.compile(r"function\([^)]*\)")
+    # Walk the array with a cursor instead of re-slicing the remainder for every element
+    i = 1
 
-    while len(curr_substring) > 0:
-        if curr_substring.startswith('function'):
+    while i < len(js_array):
+        if js_array.startswith('function', i):
             # Handle functions separately. These can contain commas
-            match = func_regex.search(curr_substring)
-            match_start, match_end = match.span()
+            match = _FUNC_RE.search(js_array, i)
+            match_end = match.end()
 
-            function_text = find_object_from_startpoint(curr_substring, match.span()[1])
-            full_function_def = curr_substring[:match_end + len(function_text)]
-            results.append(full_function_def)
-            curr_substring = curr_substring[len(full_function_def) + 1:]
+            function_text = find_object_from_startpoint(js_array, match_end)
+            function_end = match_end + len(function_text)
+            results.append(js_array[i:function_end])
+            i = function_end + 1
         else:
-            match = comma_regex.search(curr_substring)
+            match = _COMMA_RE.search(js_array, i)
 
             # Try-catch to capture end of array
             try:
                 match_start, match_end = match.span()
             except AttributeError:
-                match_start = len(curr_substring) - 1
+                match_start = len(js_array) - 1
                 match_end = match_start + 1
 
-            curr_el = curr_substring[:match_start]
-            results.append(curr_el)
-            curr_substring = curr_substring[match_end:]
+            results.append(js_array[i:match_start])
+            i = match_end
 
     return results
-
@@ -1,18 +1,19 @@
 """Implements a simple wrapper around urlopen."""
 
+import base64
 import http.client
 import json
 import logging
 import re
 import socket
-from typing import Iterable
+from typing import Dict, Iterable, Optional
 from functools import lru_cache
 from urllib import parse
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from youtube_get.utils.exceptions import RegexMatchError, MaxRetriesExceeded
-from youtube_get.utils.helpers import regex_search
+from youtube_get.utils.helpers import installed_proxies, regex_search
 
 logger = logging.getLogger("YouTube-Get-Global-Logger")
 
@@ -88,6 +89,128 @@ def post(url, extra_headers=None, data=None, timeout=socket._GLOBAL_DEFAULT_TIME
     return response.read().decode("utf-8")
 
 
+class Session:
+    """Keeps connections alive between consecutive requests to the same host.
+
+    Every call of :func:`post` opens a new connection and pays the TCP and TLS
+    handshakes again. A session holds one persistent HTTP/1.1 connection per
+    host, which is much cheaper for sequential requests such as paginating
+    through continuations.
+    """
+
+    def __init__(self, proxies: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            proxies: (Optional) A dictionary of proxies keyed by url scheme, as accepted
+                by :func:`install_proxy <youtube_get.utils.helpers.install_proxy>`.
+                Defaults to the proxies urlopen would use, i.e. the ones installed with
+                install_proxy, or else those from the environment.
+        """
+        self._proxies = proxies
+        self._connections = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _proxy(self, scheme: str, host: str) -> Optional[str]:
+        """Get the proxy to reach a host through, looked up like urlopen does."""
+        # no_proxy applies whichever way the proxies were configured
+        if proxy_bypass(host):
+            return None
+        if self._proxies is not None:
+            return self._proxies.get(scheme)
+        proxies = installed_proxies()
+        if proxies is not None:
+            return proxies.get(scheme)
+        return getproxies().get(scheme)
+
+    def _connection(self, scheme: str, host: str, timeout) -> http.client.HTTPConnection:
+        """Get the open connection to a host, creating it if needed."""
+        key = (scheme, host)
+        if key in self._connections:
+            return self._connections[key]
+
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = self._proxy(scheme, host)
+        if proxy:
+            proxy_url = parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            tunnel_headers = {}
+            if proxy_url.username:
+                credentials = f"{parse.unquote(proxy_url.username)}:{parse.unquote(proxy_url.password or '')}"
+                tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode()
+            # a proxy url without a port uses the default one of its own scheme
+            proxy_port = proxy_url.port or (443 if proxy_url.scheme == "https" else 80)
+            connection = connection_class(proxy_url.hostname, proxy_port, timeout=timeout)
+            connection.set_tunnel(host, headers=tunnel_headers)
+        else:
+            connection = connection_class(host, timeout=timeout)
+
+        self._connections[key] = connection
+        return connection
+
+    def post(self, url, extra_headers=None, data=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT) -> str:
+        """Send an http POST request over a kept-alive connection.
+
+        Args:
+            url (str): The URL to perform the POST request for.
+            extra_headers (dict): Extra headers to add to the request
+            data (dict): The data to send on the POST request
+            timeout: Timeout used when the connection to the host is opened
+
+        Returns:
+            UTF-8 encoded string of response
+        """
+        if not url.lower().startswith("http"):
+            raise ValueError("Invalid URL")
+
+        headers = {"User-Agent": "Mozilla/5.0", "accept-language": "en-US,en"}
+        if extra_headers:
+            headers.update(extra_headers)
+        # required because the youtube servers are strict on content type
+        headers["Content-Type"] = "application/json"
+        if data is None:
+            data = {}
+        if not isinstance(data, bytes):
+            data = bytes(json.dumps(data), encoding="utf-8")
+
+        split_url = parse.urlsplit(url)
+        path = split_url.path or "/"
+        if split_url.query:
+            path += "?" + split_url.query
+        key = (split_url.scheme.lower(), split_url.netloc)
+
+        # The server may drop an idle connection at any time, so a request
+        # failing on a reused connection is retried once on a fresh one.
+        # A failed connection is always dropped, it can't be reused after
+        # an aborted request or a partially read response.
+        for attempt in range(2):
+            connection = self._connection(*key, timeout)
+            try:
+                connection.request("POST", path, body=data, headers=headers)
+                response = connection.getresponse()
+                content = response.read()
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                self._connections.pop(key, None)
+                if attempt:
+                    raise
+            else:
+                break
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        return content.decode("utf-8")
+
+    def close(self) -> None:
+        """Close all open connections."""
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+
 def seq_stream(
     url: str,
     timeout=socket._GLOBAL_DEFAULT_TIMEOUT,